@@ -1,48 +1,90 @@
-import math
-from Payload import cubesat
-from environment import env
-from flight_stages import td
-from parachute import p1
+import numpy as np
 from parachute import Parachute
+from Payload import Payload
+from environment import Environment
+from flight_stages import terminal_velocity_from
+
+# Force kernels: plain float/ndarray arithmetic with no object access,
+# shared by the ForcesCalculator methods below.
+
+def _drag(rho, v, A, cd):
+    return (0.5 * rho * A * cd) * np.multiply(v, v)
+
+def _opening(rho, v, A, cl, l_over_d):
+    return (0.5 * cl * rho * A * (1 + l_over_d)) * np.multiply(v, v)
+
+def _snatch(delta_v, line_length, stiffness, n_lines):
+    return n_lines * stiffness * np.divide(delta_v, 2 * line_length)
 
 class ForcesCalculator:
     def __init__(self, environment, payload, parachute):
         self.parachute = parachute
         self.env = environment
         self.payload = payload
+        self._A = parachute.surface_area  # Reference area, fixed after construction
 
     def drag_force(self, velocity, drag_coefficient):
-        rho = self.env.density
-        A = self.parachute.surface_area
-        return 0.5 * rho * velocity**2 * A * drag_coefficient
+        """
+        Drag force for a scalar velocity or an array of velocities.
+        """
+        return _drag(self.env.density, velocity, self._A, drag_coefficient)
 
     def opening_force(self, velocity, cl, l_over_d):
-        rho = self.env.density
-        A = self.parachute.surface_area
-        return 0.5 * cl * rho * A * velocity**2 * (1 + l_over_d)
+        """
+        Opening force for a scalar velocity or an array of velocities.
+        """
+        return _opening(self.env.density, velocity, self._A, cl, l_over_d)
 
     def snatch_force(self, delta_v, line_length, stiffness=1e5, n_lines=4):
-        elongation = delta_v / (2 * line_length)
-        return n_lines * stiffness * elongation
+        return _snatch(delta_v, line_length, stiffness, n_lines)
     
+    def forces_along_trajectory(self, velocity, drag_coefficient, cl, l_over_d, line_length,
+                                stiffness=1e5, n_lines=4):
+        """
+        Evaluate drag, opening and snatch forces over a whole velocity array in one pass.
+        v² is computed once and shared by the drag and opening forces.
+        Returns three float64 arrays with the shape of velocity: (drag, opening, snatch).
+        """
+        v = np.asarray(velocity, dtype=np.float64)
+        v2 = v * v
+        rho = self.env.density
+        drag = (0.5 * rho * self._A * drag_coefficient) * v2
+        opening = (0.5 * cl * rho * self._A * (1 + l_over_d)) * v2
+        snatch = _snatch(v, line_length, stiffness, n_lines)
+        return drag, opening, snatch
+
+    def terminal_velocity(self):
+        """
+        Terminal velocity of the payload and parachute, when the drag force equals the weight.
+        Formula (shared with FlightStages through terminal_velocity_from):
+            Vt = sqrt( (2 * m * g) / (rho * Cd * A) )
+        """
+        total_mass = self.payload.mass + self.parachute.mass
+        return terminal_velocity_from(total_mass, self.env.g, self.env.density,
+                                      self.parachute.drag_area)
+
     def report(self):
         """
         Print a report of the forces acting on the payload.
         """
+        v_term = self.terminal_velocity()
         print(f"\n--- Forces Report for {self.payload.name} ---")
         print(f"Environment Density: {self.env.density:.3f} kg/m³")
         print(f"Payload Mass: {self.payload.mass:.2f} kg")
         print(f"Frontal Area: {self.payload.frontal_area():.3f} m²")
-        print(f"Drag Force at terminal velocity: {self.drag_force(td.terminal_velocity(), 1.5):.2f} N")
-        print(f"Opening Force: {self.opening_force(td.terminal_velocity(), 1.75, 0.5):.2f} N")
-        print(f"Snatch Force: {self.snatch_force(td.terminal_velocity(), 5.0):.2f} N")
+        print(f"Drag Force at terminal velocity: {self.drag_force(v_term, 1.5):.2f} N")
+        print(f"Opening Force: {self.opening_force(v_term, 1.75, 0.5):.2f} N")
+        print(f"Snatch Force: {self.snatch_force(v_term, 5.0):.2f} N")
 
 # ----------------------------- Demo ----------------------------------
 
 if __name__ == "__main__":
+    cubesat = Payload("CubeSat-Alpha", 12.0, "cuboid", 0.2, 0.2, 0.2)
+    p1 = Parachute(10, 1.5, mass=5, shape="reefed")
+    env = Environment(altitude=1000)
     calc = ForcesCalculator(env, cubesat, p1)
 
-    velocity    = td.terminal_velocity()   
+    velocity    = calc.terminal_velocity()
     cd          = 1.5
     cl          = 1.75
     l_over_d    = 0.5
@@ -1,24 +1,10 @@
 import math
 import numpy as np
-import matplotlib.pyplot as plt
 from parachute import Parachute
 from flight_stages import FlightStages
 from Payload import Payload
 from environment import Environment
 
-cubesat = Payload("CubeSat-Alpha", 12.0, "cuboid", 0.2, 0.2, 0.2)
-p1 = Parachute(10, 1.5, mass=5, shape="reefed")
-env = Environment(altitude=1000)
-
-td = FlightStages(
-    payload=cubesat,
-    parachute=p1,
-    environment=env,
-    t_max=60,
-    t_deploy=2.0,
-    horizontal_speed=1.0
-)
-
 class ParachuteOscillationEstimator:
     def __init__(self, parachute: Parachute, flight_stages: FlightStages, damping_ratio=0.15, natural_freq=0.8, initial_angle=5.0, z0=1000, t_max=60):
         """
@@ -28,9 +14,10 @@ class ParachuteOscillationEstimator:
         self.parachute = parachute
         # Use total mass from flight_stages for initial calculation
         self.mass = flight_stages.total_mass
-        self.zeta = damping_ratio  # Damping ratio (ζ)
-        self.omega_n = natural_freq  # Natural frequency (ω_n) [rad/s]
-        self.theta0 = np.deg2rad(initial_angle)  # Initial angle of attack [rad]
+        self._zeta = damping_ratio  # Damping ratio (ζ)
+        self._omega_n = natural_freq  # Natural frequency (ω_n) [rad/s]
+        self._update_damping()
+        self.theta0 = initial_angle * (math.pi / 180.0)  # Initial angle of attack [rad]
         self.z0 = flight_stages.z0  # Initial altitude [m]
         self.t_max = flight_stages.t_max  # Maximum simulation time [s]
         self.terminal_velocity = flight_stages.terminal_velocity()  # Terminal descent velocity [m/s]
@@ -39,6 +26,35 @@ class ParachuteOscillationEstimator:
         self.mass = parachute.mass
         self.drag_area = self.parachute.drag_area
 
+        # One-slot cache for simulate(): parameters of the last run and its arrays
+        self._sim_key = None
+        self._sim_result = None
+
+    @property
+    def zeta(self):
+        return self._zeta
+
+    @zeta.setter
+    def zeta(self, value):
+        self._zeta = value
+        self._update_damping()
+
+    @property
+    def omega_n(self):
+        return self._omega_n
+
+    @omega_n.setter
+    def omega_n(self, value):
+        self._omega_n = value
+        self._update_damping()
+
+    def _update_damping(self):
+        """
+        Precompute the damped frequency ω_d = ωₙ·sqrt(1 - ζ²) and the decay rate ζ·ωₙ.
+        """
+        self._omega_d = self._omega_n * math.sqrt(1 - self._zeta * self._zeta)
+        self._decay = self._zeta * self._omega_n
+
     def simulate(self, dt=0.1):
         """
         Simulate oscillations and descent.
@@ -52,19 +68,44 @@ class ParachuteOscillationEstimator:
             ω_d = damped natural frequency = ωₙ·sqrt(1 - ζ²)
 
         Altitude is modeled as a uniform descent at terminal velocity:
-            z(t) = z₀ - v_terminal · t
-        """
-        t, z, _, _, _ = self.flight_stages.generate_trajectory(dt=dt)
-
-        t = np.arange(0, self.t_max, dt)
-        omega_d = self.omega_n * np.sqrt(1 - self.zeta**2)  # Damped natural frequency
-        theta = self.theta0 * np.exp(-self.zeta * self.omega_n * t) * np.cos(omega_d * t)  # Angle in radians
-        theta_deg = np.rad2deg(theta)  # Convert angle to degrees
+            z(t) = max(z₀ - v_terminal · t, 0)
+        Both are evaluated over the same time grid, so θ and z always have the length of t.
 
-        return t, theta_deg, z
+        Results are cached: calling again with the same dt and unchanged parameters
+        returns the previous (read-only) arrays instead of recomputing them.
+        """
+        key = (dt, self.t_max, self.zeta, self.omega_n, self.theta0, self.z0, self.terminal_velocity)
+        if key == self._sim_key:
+            return self._sim_result
+
+        # Same samples as np.arange(0, t_max, dt), but built as i*dt so the step is exactly dt
+        # without accumulating round-off; always at least the t = 0 sample
+        n = max(math.ceil(self.t_max / dt), 1)
+        t = np.arange(n, dtype=float) * dt
+
+        # θ(t) built in place: one buffer for the envelope, one for the cosine
+        theta = np.multiply(t, -self._decay)
+        np.exp(theta, out=theta)
+        cos_term = np.multiply(t, self._omega_d)
+        np.cos(cos_term, out=cos_term)
+        theta *= cos_term
+        theta *= self.theta0 * (180.0 / math.pi)  # Scale by θ₀ and convert to degrees in one pass
+        theta_deg = theta
+
+        z = self.z0 - self.terminal_velocity * t
+        np.maximum(z, 0.0, out=z)  # Clamp at ground level without a boolean mask
+
+        # Cached arrays are shared between callers, so protect them from mutation
+        for arr in (t, theta_deg, z):
+            arr.flags.writeable = False
+        self._sim_key = key
+        self._sim_result = (t, theta_deg, z)
+
+        return self._sim_result
 
     def plot_oscillations(self):
-    
+        import matplotlib.pyplot as plt  # Imported lazily so non-plotting users skip pyplot
+
         t, theta, z = self.simulate()
 
         t_deploy = self.flight_stages.t_deploy
@@ -106,13 +147,27 @@ class ParachuteOscillationEstimator:
 
 # Example usage
 
-p1 = Parachute(diameter=10, drag_coefficient=1.5, shape="reefed", mass=80)
-estimator = ParachuteOscillationEstimator(
-        parachute=p1,
-        flight_stages=td,
-        damping_ratio=0.18,
-        natural_freq=0.7,
-        initial_angle=7.0,
-        z0=1000,
-        t_max=60)
+if __name__ == "__main__":
+    cubesat = Payload("CubeSat-Alpha", 12.0, "cuboid", 0.2, 0.2, 0.2)
+    p1 = Parachute(10, 1.5, mass=5, shape="reefed")
+    env = Environment(altitude=1000)
 
+    td = FlightStages(
+        payload=cubesat,
+        parachute=p1,
+        environment=env,
+        t_max=60,
+        t_deploy=2.0,
+        horizontal_speed=1.0
+    )
+
+    p2 = Parachute(diameter=10, drag_coefficient=1.5, shape="reefed", mass=80)
+    estimator = ParachuteOscillationEstimator(
+            parachute=p2,
+            flight_stages=td,
+            damping_ratio=0.18,
+            natural_freq=0.7,
+            initial_angle=7.0,
+            z0=1000,
+            t_max=60)
+    estimator.plot_oscillations()
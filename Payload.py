@@ -1,8 +1,26 @@
 import math
+from enum import IntEnum
 
 from report import Report
 
+class PayloadShape(IntEnum):
+    """
+    Integer identifiers for the supported payload shapes.
+    """
+    CUBOID = 0
+    CYLINDER = 1
+    SPHERE = 2
+
+_PAYLOAD_SHAPES = {
+    "cuboid": PayloadShape.CUBOID,
+    "cylinder": PayloadShape.CYLINDER,
+    "sphere": PayloadShape.SPHERE,
+}
+
 class Payload(Report):
+    __slots__ = ("name", "mass", "shape", "_shape_id", "width", "height", "depth",
+                 "_radius", "_volume", "_frontal_area", "_cog", "_density")
+
     def __init__(self, name, mass, shape, width, height, depth=None):
         """
         Initialize a Payload object.
@@ -21,6 +39,38 @@ class Payload(Report):
         self.width = width
         self.height = height
         self.depth = depth if depth is not None else width  # For sphere/cylinder, depth is not needed
+        self._radius = 0.5 * width  # Radius for cylinder/sphere
+
+        # Parse the shape string once; everything else branches on the integer id
+        if self.shape not in _PAYLOAD_SHAPES:
+            raise ValueError("Unknown shape")
+        self._shape_id = _PAYLOAD_SHAPES[self.shape]
+
+        # Dimensions never change after construction, so the geometric
+        # properties are computed once here and reused by every call
+        self._compute_geometry()
+
+    def _compute_geometry(self):
+        """
+        Dispatch once on the shape and store volume, frontal area,
+        center of gravity and density.
+        """
+        shape_id = self._shape_id
+        if shape_id == PayloadShape.CUBOID:
+            self._volume = self.width * self.height * self.depth
+            self._frontal_area = self.width * self.height
+            self._cog = (self.width / 2, self.height / 2, self.depth / 2)
+        elif shape_id == PayloadShape.CYLINDER:
+            radius = self._radius
+            self._volume = math.pi * radius * radius * self.height
+            self._frontal_area = math.pi * radius * radius
+            self._cog = (radius, self.height / 2, radius)
+        else:  # PayloadShape.SPHERE
+            radius = self._radius
+            self._volume = (4/3) * math.pi * radius * radius * radius
+            self._frontal_area = math.pi * radius * radius
+            self._cog = (radius, radius, radius)
+        self._density = self.mass / self._volume
 
     def volume(self):
         """
@@ -31,16 +81,7 @@ class Payload(Report):
         - Cylinder: V = π * r^2 * height, where r = width / 2
         - Sphere: V = (4/3) * π * r^3, where r = width / 2
         """
-        if self.shape == "cuboid":
-            return self.width * self.height * self.depth
-        elif self.shape == "cylinder":
-            radius = self.width / 2
-            return math.pi * radius**2 * self.height
-        elif self.shape == "sphere":
-            radius = self.width / 2
-            return (4/3) * math.pi * radius**3
-        else:
-            raise ValueError("Unknown shape")
+        return self._volume
 
     def center_of_gravity(self):
         """
@@ -51,15 +92,7 @@ class Payload(Report):
         - Cylinder: (width/2, height/2, width/2)
         - Sphere: (r, r, r)
         """
-        if self.shape == "cuboid":
-            return (self.width / 2, self.height / 2, self.depth / 2)
-        elif self.shape == "cylinder":
-            return (self.width / 2, self.height / 2, self.width / 2)
-        elif self.shape == "sphere":
-            r = self.width / 2
-            return (r, r, r)
-        else:
-            raise ValueError("Unknown shape")
+        return self._cog
         
     def density(self):
         """
@@ -68,7 +101,7 @@ class Payload(Report):
         Formula:
         - Density = mass / volume
         """
-        return self.mass / self.volume()
+        return self._density
 
     def frontal_area(self):
         """
@@ -78,13 +111,7 @@ class Payload(Report):
         - Cuboid: A = width * height
         - Cylinder/Sphere: A = π * r^2, where r = width / 2
         """
-        if self.shape == "cuboid":
-            return self.width * self.height
-        elif self.shape == "cylinder" or self.shape == "sphere":
-            radius = self.width / 2
-            return math.pi * radius**2
-        else:
-            raise ValueError("Unknown shape")
+        return self._frontal_area
 
     def report(self):
         """
@@ -100,11 +127,13 @@ class Payload(Report):
         print(f"Frontal Area: {self.frontal_area():.3f} m²")
 
 # Example: Create a Payload object for a CubeSat and print its report
-cubesat = Payload(
-    name="CubeSat-Alpha",
-    mass=12.0,              # Mass in kg
-    shape="cuboid",
-    width=0.2,              # Width in meters
-    height=0.2,             # Height in meters
-    depth=0.2               # Depth in meters
-)
+if __name__ == "__main__":
+    cubesat = Payload(
+        name="CubeSat-Alpha",
+        mass=12.0,              # Mass in kg
+        shape="cuboid",
+        width=0.2,              # Width in meters
+        height=0.2,             # Height in meters
+        depth=0.2               # Depth in meters
+    )
+    cubesat.report()
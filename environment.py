@@ -37,4 +37,6 @@ class Environment:
         print(f"Wind (horizontal): {self.wind_horizontal} m/s (Direction: {self.wind_direction}°)")
         print(f"Wind (vertical): {self.wind_vertical} m/s")
 
-env = Environment()
\ No newline at end of file
+if __name__ == "__main__":
+    env = Environment()
+    env.summary()
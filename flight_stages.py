@@ -1,14 +1,57 @@
 import math
+import os
 import numpy as np
-import matplotlib.pyplot as plt
 from parachute import Parachute
 from Payload import Payload
 from environment import Environment
 
-# Initialize Payload, Parachute, and Environment objects
-cubesat = Payload("CubeSat-Alpha", 12.0, "cuboid", 0.2, 0.2, 0.2)
-p1 = Parachute(10, 1.5, mass=5, shape="reefed")
-env = Environment(altitude=1000)
+# matplotlib is imported inside the plotting methods, so trajectory-only
+# users (e.g. Monte Carlo sweeps) never load pyplot
+
+
+def terminal_velocity_from(mass, g, rho, drag_area):
+    """
+    Terminal velocity, when the drag force equals the weight:
+        Vt = sqrt( (2 * m * g) / (rho * Cd * A) )
+    An array of masses takes np.sqrt and gives an array of velocities in one call;
+    scalars take math.sqrt, which is much cheaper than a ufunc call.
+    """
+    if isinstance(mass, np.ndarray):
+        return np.sqrt((2 * mass * g) / (rho * drag_area))
+    return math.sqrt((2 * mass * g) / (rho * drag_area))
+
+
+def _ground_impact_time(z0, g, t_deploy, t_inflation, v0, a_infl, terminal_velocity):
+    """
+    Exact time at which the three-stage descent reaches z = 0.
+    Each stage is a polynomial in its relative time, so the first root is found in closed form.
+    Evaluated element-wise, so arrays of parameters (as in generate_trajectories) give one time per sample.
+    """
+    z0_infl = z0 - 0.5 * g * t_deploy * t_deploy
+    z0_term = z0_infl + v0 * t_inflation + 0.5 * a_infl * t_inflation * t_inflation
+
+    # Roots that do not exist come out as NaN or inf and fail the range check below
+    with np.errstate(divide="ignore", invalid="ignore"):
+        # Free fall: z0 - 0.5*g*t² = 0
+        t_free = np.sqrt(2 * z0 / g)
+
+        # Inflation stage: z0_infl + v0*tr + 0.5*a_infl*tr² = 0 (linear when a_infl is 0)
+        sq = np.sqrt(v0 * v0 - 2 * a_infl * z0_infl)
+        r1 = (-v0 - sq) / a_infl
+        r2 = (-v0 + sq) / a_infl
+        r_lin = np.divide(-z0_infl, v0)
+
+    def in_stage(r):
+        return (r >= 0) & (r <= t_inflation)
+
+    r_lo = np.fmin(r1, r2)
+    r_hi = np.fmax(r1, r2)
+    t_rel = np.where(a_infl == 0, np.where(in_stage(r_lin), r_lin, np.nan),
+                     np.where(in_stage(r_lo), r_lo, np.where(in_stage(r_hi), r_hi, np.nan)))
+
+    # Terminal descent: z0_term - Vt*tr = 0
+    t_term = t_deploy + t_inflation + z0_term / terminal_velocity
+    return np.where(z0_infl <= 0, t_free, np.where(np.isnan(t_rel), t_term, t_deploy + t_rel))
 
 
 class FlightStages:
@@ -43,14 +86,22 @@ class FlightStages:
         self.rho = environment.compute_density()
         self.total_mass = payload.mass + parachute.mass
 
+        # One-slot caches: parameters of the last evaluation and its result
+        self._v_term_key = None
+        self._v_term = None
+        self._traj_key = None
+        self._traj_result = None
+
     def terminal_velocity(self):
         """
-        Calculate the terminal velocity after parachute inflation, when the drag force equals the weight.
-        Formula:
-            Vt = sqrt( (2 * m * g) / (rho * Cd * A) )
+        Terminal velocity after parachute inflation, when the drag force equals the weight.
+        Cached: recomputed only when mass, g, density or drag area changed since the last call.
         """
-        return math.sqrt((2 * self.total_mass * self.g) /
-                         (self.rho * self.parachute.drag_area)) # drag_area is Cd * A
+        key = (self.total_mass, self.g, self.rho, self.parachute.drag_area)  # drag_area is Cd * A
+        if key != self._v_term_key:
+            self._v_term = terminal_velocity_from(*key)
+            self._v_term_key = key
+        return self._v_term
 
     def generate_trajectory(self, dt=0.1):
         """
@@ -59,111 +110,232 @@ class FlightStages:
         2. Inflation stage (constant deceleration)
         3. Terminal descent (constant velocity)
         Returns arrays for time, altitude, velocity, horizontal position, and acceleration.
+
+        Results are cached: calling again with the same dt and unchanged parameters
+        returns the previous (read-only) arrays instead of recomputing them.
         """
-        v0 = -self.g * self.t_deploy  # velocity at the end of free fall
+        key = (dt, self.t_max, self.t_deploy, self.t_inflation, self.z0, self.horizontal_speed,
+               self.g, self.rho, self.total_mass, self.parachute.drag_area)
+        if key == self._traj_key:
+            return self._traj_result
+
+        result = self._compute_trajectory(dt)
+
+        # Cached arrays are shared between callers, so protect them from mutation
+        for arr in result:
+            arr.flags.writeable = False
+        self._traj_key = key
+        self._traj_result = result
+
+        return result
+
+    def _compute_trajectory(self, dt):
+        """
+        Evaluate the three-stage descent on a time grid with step dt,
+        ending at the analytic ground-impact time when it falls before t_max.
+        """
+        g = self.g
+        z0 = self.z0
+        t_deploy = self.t_deploy
+        t_inflation = self.t_inflation
+
+        v0 = -g * t_deploy  # velocity at the end of free fall
         terminal_velocity = self.terminal_velocity()
-        a_infl = min((v0 + terminal_velocity) / self.t_inflation, 4 * self.g)
+        a_infl = min((v0 + terminal_velocity) / t_inflation, 4 * g)
+
+        # Stage start altitudes and end of inflation, fixed for the whole run
+        z0_infl = z0 - 0.5 * g * t_deploy * t_deploy
+        z0_term = z0_infl + v0 * t_inflation + 0.5 * a_infl * t_inflation * t_inflation
+        t_infl_end = t_deploy + t_inflation
+
+        # Every stage is closed-form in time, so all samples are evaluated at once.
+        # If the ground is reached before t_max, the grid stops there with one exact landing sample.
+        t = np.arange(int(self.t_max / dt + 1e-9) + 1) * dt
+        t_ground = float(_ground_impact_time(z0, g, t_deploy, t_inflation, v0, a_infl, terminal_velocity))
+        landed = t_ground <= self.t_max
+        if landed:
+            t = np.append(t[t < t_ground], t_ground)
+
+        # Stage selection: np.select takes the first matching condition, the default is terminal descent
+        stages = [t < t_deploy, t < t_infl_end]
+        t_infl = t - t_deploy
+        t_term = t - t_infl_end
+
+        z = np.select(stages, [z0 - 0.5 * g * t * t,
+                               z0_infl + v0 * t_infl + 0.5 * a_infl * t_infl * t_infl],
+                      default=z0_term - terminal_velocity * t_term)
+        v = np.select(stages, [-g * t, v0 + a_infl * t_infl], default=-terminal_velocity)
+        a = np.select(stages, [-g, a_infl], default=0.0)
+
+        if landed:
+            z[-1] = 0.0  # Exact by construction; removes round-off in the stage polynomial
 
-        t_values, z_values, v_values, x_values, a_values = [], [], [], [], []
+        # Constant horizontal speed: position is exactly proportional to time
+        x = self.horizontal_speed * t
 
-        t = 0
-        z = self.z0
-        x = 0
+        return t, z, v, x, a
 
-        while z > 0 and t <= self.t_max:
-            if t < self.t_deploy:
-                z = self.z0 - 0.5 * self.g * t**2
-                v = -self.g * t
-                a = -self.g
+    def generate_trajectories(self, mass=None, t_deploy=None, z0=None, horizontal_speed=None, dt=0.1,
+                              dtype=np.float32):
+        """
+        Evaluate many descents at once, e.g. for Monte Carlo sweeps.
+        mass (total mass), t_deploy, z0 and horizontal_speed may be arrays of shape (N,);
+        any parameter left as None uses this simulation's value. Parachute, density and
+        inflation time are shared by all samples.
+        Returns t with shape (T,) and z, v, x, a with shape (N, T) on the common grid up to t_max.
+        Once a sample reaches the ground its altitude, velocity and acceleration stay at 0
+        and its horizontal position stays at its value at the exact touchdown time.
+        The computation and outputs use dtype, float32 by default: sweep outputs are large and
+        single precision is well within the accuracy of the model. Pass np.float64 if needed.
+        """
+        g = self.g
+        t_inflation = self.t_inflation
+        mass, t_deploy, z0, hs = np.broadcast_arrays(
+            np.atleast_1d(np.asarray(self.total_mass if mass is None else mass, dtype=dtype)),
+            np.atleast_1d(np.asarray(self.t_deploy if t_deploy is None else t_deploy, dtype=dtype)),
+            np.atleast_1d(np.asarray(self.z0 if z0 is None else z0, dtype=dtype)),
+            np.atleast_1d(np.asarray(self.horizontal_speed if horizontal_speed is None else horizontal_speed,
+                                     dtype=dtype)))
+        if np.any(mass <= 0):
+            raise ValueError("Mass must be greater than zero.")
+        if np.any(z0 <= 0):
+            raise ValueError("Initial height must be greater than zero.")
+        if np.any(t_deploy < 0):
+            raise ValueError("Deployment time cannot be negative.")
 
-            elif t < self.t_deploy + self.t_inflation:
-                t_rel = t - self.t_deploy
-                z0_infl = self.z0 - 0.5 * self.g * self.t_deploy**2
-                v = v0 + a_infl * t_rel
-                z = z0_infl + v0 * t_rel + 0.5 * a_infl * t_rel**2
-                a = a_infl
+        # Per-sample stage constants, shape (N, 1) so they broadcast against the time axis
+        v0 = -g * t_deploy
+        terminal_velocity = terminal_velocity_from(mass, g, self.rho, self.parachute.drag_area)
+        a_infl = np.minimum((v0 + terminal_velocity) / t_inflation, 4 * g)
+        z0_infl = z0 - 0.5 * g * t_deploy * t_deploy
+        z0_term = z0_infl + v0 * t_inflation + 0.5 * a_infl * t_inflation * t_inflation
+        t_infl_end = t_deploy + t_inflation
+        t_ground = _ground_impact_time(z0, g, t_deploy, t_inflation, v0, a_infl, terminal_velocity)
+        v0, terminal_velocity, a_infl, z0, z0_infl, z0_term, t_deploy, t_infl_end, hs, t_ground = (
+            p[:, None] for p in (v0, terminal_velocity, a_infl, z0, z0_infl, z0_term,
+                                 t_deploy, t_infl_end, hs, t_ground))
 
-            else:
-                t_rel = t - (self.t_deploy + self.t_inflation)
-                v = -terminal_velocity
-                z0_term = self.z0 - 0.5 * self.g * self.t_deploy**2 + \
-                          (v0 * self.t_inflation + 0.5 * a_infl * self.t_inflation**2)
-                z = z0_term + v * t_rel
-                a = 0
+        t = (np.arange(int(self.t_max / dt + 1e-9) + 1) * dt).astype(dtype)
 
-            x += self.horizontal_speed * dt
+        # Stage selection as in _compute_trajectory; (N, 1) parameters against (T,) times give (N, T)
+        stages = [t < t_deploy, t < t_infl_end]
+        t_infl = t - t_deploy
+        t_term = t - t_infl_end
 
-            t_values.append(t)
-            z_values.append(max(z, 0))
-            v_values.append(v)
-            x_values.append(x)
-            a_values.append(a)
+        z = np.select(stages, [z0 - 0.5 * g * t * t,
+                               z0_infl + v0 * t_infl + 0.5 * a_infl * t_infl * t_infl],
+                      default=z0_term - terminal_velocity * t_term).astype(dtype, copy=False)
+        v = np.select(stages, [-g * t, v0 + a_infl * t_infl],
+                      default=-terminal_velocity).astype(dtype, copy=False)
+        a = np.select(stages, [-g, a_infl], default=0.0).astype(dtype, copy=False)
 
-            if z <= 0:
-                break
-            t += dt
+        # Samples on the ground stay there; x freezes at the exact touchdown time
+        landed = z <= 0
+        z[landed] = 0
+        v[landed] = 0
+        a[landed] = 0
+        x = (hs * np.minimum(t, t_ground)).astype(dtype, copy=False)
 
-        return np.array(t_values), np.array(z_values), np.array(v_values), np.array(x_values), np.array(a_values)
+        return t, z, v, x, a
 
-    def plot_trajectory(self):
+    def plot_trajectory(self, show=True, save_path=None):
         """
-        Plot altitude vs time, showing deployment and inflation stages
+        Plot altitude vs time, showing deployment and inflation stages.
+        Returns the Figure; it is saved to save_path if given and shown only if show is True.
         """
         t, z, _, x, _ = self.generate_trajectory()
-        plt.figure(figsize=(8, 5))
-        plt.plot(t, z, label="Altitude")
-        plt.axvline(self.t_deploy, color='orange', linestyle='--', label="Deployment")
-        plt.axvline(self.t_deploy + self.t_inflation, color='green', linestyle='--', label="End of Inflation")
-        plt.xlabel("Time [s]")
-        plt.ylabel("Altitude [m]")
-        plt.title("Trajectory with Deployment and Inflation Stages")
-        plt.grid(True)
-        plt.legend()
-        plt.tight_layout()
-        plt.show()
-        print(f"\nHorizontal displacement: {x[-1]:.2f} m")
-    
-    def plot_velocity(self):
+        return self._finish_figure(self._plot_trajectory(t, z, x), show, save_path)
+
+    def plot_velocity(self, show=True, save_path=None):
         """
-        Plot velocity vs time, showing deployment and inflation stages
+        Plot velocity vs time, showing deployment and inflation stages.
+        Returns the Figure; it is saved to save_path if given and shown only if show is True.
         """
         t, _, v, _, _ = self.generate_trajectory()
-        plt.figure(figsize=(8, 5))
-        plt.plot(t, v, label="Velocity", color='red')
-        plt.axvline(self.t_deploy, color='orange', linestyle='--', label="Deployment")
-        plt.axvline(self.t_deploy + self.t_inflation, color='green', linestyle='--', label="End of Inflation")
-        plt.xlabel("Time [s]")
-        plt.ylabel("Velocity [m/s]")
-        plt.title("Velocity with Deployment and Inflation Stages")
-        plt.grid(True)
-        plt.legend()
-        plt.tight_layout()
-        plt.show()
-
-    def plot_acceleration(self):
-        """
-        Plot acceleration vs time, showing deployment and inflation stages
+        return self._finish_figure(self._plot_velocity(t, v), show, save_path)
+
+    def plot_acceleration(self, show=True, save_path=None):
+        """
+        Plot acceleration vs time, showing deployment and inflation stages.
+        Returns the Figure; it is saved to save_path if given and shown only if show is True.
         """
         t, _, _, _, a = self.generate_trajectory()
-        plt.figure(figsize=(8, 5))
-        plt.plot(t, a, label="Acceleration", color='green')
-        plt.axvline(self.t_deploy, color='orange', linestyle='--', label="Deployment")
-        plt.axvline(self.t_deploy + self.t_inflation, color='blue', linestyle='--', label="End of Inflation")
-        plt.xlabel("Time [s]")
-        plt.ylabel("Acceleration [m/s²]")
-        plt.title("Acceleration with Deployment and Inflation Stages")
-        plt.grid(True)
-        plt.legend()
-        plt.tight_layout()
-        plt.show()
-
-    def simulate(self):
-        """
-        Run the simulation and plot all trajectories
-        """
-        self.plot_trajectory()
-        self.plot_velocity()
-        self.plot_acceleration()
+        return self._finish_figure(self._plot_acceleration(t, a), show, save_path)
+
+    @staticmethod
+    def _finish_figure(fig, show, save_path):
+        import matplotlib.pyplot as plt
+
+        if save_path is not None:
+            fig.savefig(save_path)
+        if show:
+            plt.show()
+        return fig
+
+    def _plot_trajectory(self, t, z, x):
+        import matplotlib.pyplot as plt
+
+        fig, ax = plt.subplots(figsize=(8, 5))
+        ax.plot(t, z, label="Altitude")
+        ax.axvline(self.t_deploy, color='orange', linestyle='--', label="Deployment")
+        ax.axvline(self.t_deploy + self.t_inflation, color='green', linestyle='--', label="End of Inflation")
+        ax.set_xlabel("Time [s]")
+        ax.set_ylabel("Altitude [m]")
+        ax.set_title("Trajectory with Deployment and Inflation Stages")
+        ax.grid(True)
+        ax.legend()
+        fig.tight_layout()
+        print(f"\nHorizontal displacement: {x[-1]:.2f} m")
+        return fig
+
+    def _plot_velocity(self, t, v):
+        import matplotlib.pyplot as plt
+
+        fig, ax = plt.subplots(figsize=(8, 5))
+        ax.plot(t, v, label="Velocity", color='red')
+        ax.axvline(self.t_deploy, color='orange', linestyle='--', label="Deployment")
+        ax.axvline(self.t_deploy + self.t_inflation, color='green', linestyle='--', label="End of Inflation")
+        ax.set_xlabel("Time [s]")
+        ax.set_ylabel("Velocity [m/s]")
+        ax.set_title("Velocity with Deployment and Inflation Stages")
+        ax.grid(True)
+        ax.legend()
+        fig.tight_layout()
+        return fig
+
+    def _plot_acceleration(self, t, a):
+        import matplotlib.pyplot as plt
+
+        fig, ax = plt.subplots(figsize=(8, 5))
+        ax.plot(t, a, label="Acceleration", color='green')
+        ax.axvline(self.t_deploy, color='orange', linestyle='--', label="Deployment")
+        ax.axvline(self.t_deploy + self.t_inflation, color='blue', linestyle='--', label="End of Inflation")
+        ax.set_xlabel("Time [s]")
+        ax.set_ylabel("Acceleration [m/s²]")
+        ax.set_title("Acceleration with Deployment and Inflation Stages")
+        ax.grid(True)
+        ax.legend()
+        fig.tight_layout()
+        return fig
+
+    def simulate(self, show=True, save_dir=None):
+        """
+        Run the simulation once and plot trajectory, velocity and acceleration from the same result.
+        If save_dir is given, the figures are written there as trajectory.png, velocity.png and
+        acceleration.png. Set show=False for batch runs; the three Figures are returned either way.
+        """
+        import matplotlib.pyplot as plt
+
+        t, z, v, x, a = self.generate_trajectory()
+        figures = (self._plot_trajectory(t, z, x),
+                   self._plot_velocity(t, v),
+                   self._plot_acceleration(t, a))
+        if save_dir is not None:
+            for fig, name in zip(figures, ("trajectory", "velocity", "acceleration")):
+                fig.savefig(os.path.join(save_dir, f"{name}.png"))
+        if show:
+            plt.show()
+        return figures
 
     def get_state_at_time(self, time_query, dt=0.1):
         """
@@ -176,7 +348,10 @@ class FlightStages:
             print(f"\n[WARNING] The time consulted ({time_query:.1f} s) exceeds the simulated interval (up to {t[-1]:.2f} s). Showing last state:\n")        
             idx = -1
         else:
-            idx = np.abs(t - time_query).argmin()
+            # t is sorted: binary search, then pick the closer of the two neighbours
+            idx = int(np.searchsorted(t, time_query))
+            if idx > 0 and (idx == len(t) or time_query - t[idx - 1] <= t[idx] - time_query):
+                idx -= 1
 
         state = {
             "Time [s]": t[idx],
@@ -189,14 +364,19 @@ class FlightStages:
         for k, val in state.items():
             print(f"{k:>25}: {val:.3f}")
 
-td = FlightStages(
-    payload=cubesat,
-    parachute=p1,
-    environment=env,
-    t_max=60,
-    t_deploy=2.0,
-    horizontal_speed=1.0
-)
-
-
+if __name__ == "__main__":
+    # Initialize Payload, Parachute, and Environment objects
+    cubesat = Payload("CubeSat-Alpha", 12.0, "cuboid", 0.2, 0.2, 0.2)
+    p1 = Parachute(10, 1.5, mass=5, shape="reefed")
+    env = Environment(altitude=1000)
 
+    td = FlightStages(
+        payload=cubesat,
+        parachute=p1,
+        environment=env,
+        t_max=60,
+        t_deploy=2.0,
+        horizontal_speed=1.0
+    )
+    td.simulate()
+    td.get_state_at_time(10.0)
@@ -1,8 +1,99 @@
+import functools
 import math
-import matplotlib.pyplot as plt
+import sys
+import numpy as np
+from enum import IntEnum
+from types import MappingProxyType
+from typing import NamedTuple
 from report import Report
 
+_QUARTER_PI = math.pi * 0.25  # Area of a circle per diameter²
+_min = min  # Module global, found before the builtins lookup in _inflated_area
+
+class ParachuteShape(IntEnum):
+    """
+    Integer identifiers for the supported parachute shapes, used to index the tables below.
+    """
+    FLAT = 0
+    HEMISPHERICAL = 1
+    CONICAL = 2
+    RIBBON = 3
+    REEFED = 4
+    GUIDE_SURFACE = 5
+    SQUARE = 6
+
+_PARACHUTE_SHAPES = MappingProxyType({
+    "flat": ParachuteShape.FLAT,
+    "hemispherical": ParachuteShape.HEMISPHERICAL,
+    "conical": ParachuteShape.CONICAL,
+    "ribbon": ParachuteShape.RIBBON,
+    "reefed": ParachuteShape.REEFED,
+    "guide_surface": ParachuteShape.GUIDE_SURFACE,
+    "square": ParachuteShape.SQUARE,
+})
+_DEFAULT_SHAPE = ParachuteShape.HEMISPHERICAL  # Used when the shape is not found
+
+# Tables indexed by ParachuteShape
+#                shape:  flat         hemi         conical      ribbon       reefed       guide        square
+_AREA_FACTOR = (_QUARTER_PI, _QUARTER_PI, _QUARTER_PI, _QUARTER_PI, _QUARTER_PI, _QUARTER_PI, 1.0)  # Surface area / diameter²
+_OPEN_CX =     (1.8,         1.5,         1.3,         1.0,         0.6,         1.4,         1.2)  # Opening force coefficient
+_OPEN_T =      (0.7,         1.0,         1.2,         1.8,         2.0,         1.0,         1.0)  # Inflation time (s)
+_SL_RATIO =    (1.0,         1.2,         1.3,         1.0,         1.0,         1.3,         1.1)  # Suspension line length / diameter
+# Square parachutes: the diameter is the side length, other properties assumed similar to hemispherical
+
+def _inflated_area(time, area_over_tinf2, t_inf):
+    """
+    Inflation law shared by Parachute, ParachuteBatch and the plot samples.
+    Time is clamped at the inflation time, so once fully inflated this gives drag_area without a branch.
+    A scalar time (with a scalar t_inf) takes the plain min() path, much cheaper than a ufunc call;
+    anything else goes through np.minimum.
+    Formula: A(t) = (drag_area / t_inf²) * min(t, t_inf)²
+    """
+    if isinstance(time, (float, int)):
+        t = _min(time, t_inf)
+    else:
+        t = np.minimum(time, t_inf)
+    return area_over_tinf2 * t * t
+
+@functools.lru_cache(maxsize=64)
+def _inflation_samples(t_max, steps, t_inf, area_over_tinf2):
+    """
+    Times and inflated drag areas plotted by plot_inflation_profile, cached so that parachutes
+    with the same inflation profile reuse the arrays (returned read-only because they are shared)
+    """
+    times = np.linspace(0.0, t_max, steps + 1)
+    areas = _inflated_area(times, area_over_tinf2, t_inf)
+    times.flags.writeable = False
+    areas.flags.writeable = False
+    return times, areas
+
+class ParachuteBatch(NamedTuple):
+    """
+    Properties of N parachutes stored as arrays (one entry per parachute), returned by Parachute.batch
+    """
+    drag_area: np.ndarray
+    surface_area: np.ndarray
+    inflation_time: np.ndarray
+    opening_force_coefficient: np.ndarray
+    suspension_line_length: np.ndarray
+
+    def inflated_area(self, time):
+        """
+        Inflated drag area of every parachute at the given time, same law as Parachute.get_inflated_drag_area
+        """
+        t_inf = self.inflation_time
+        return _inflated_area(np.asarray(time), self.drag_area / (t_inf * t_inf), t_inf)  # Array path: t_inf is an array
+
 class Parachute(Report):
+    __slots__ = ("diameter", "drag_coefficient", "mass", "shape", "_shape_id",
+                 "surface_area", "area", "_drag_area", "suspension_line_length",
+                 "opening_force_coefficient", "_inflation_time", "_area_over_tinf2")
+
+    # Figure reused by plot_inflation_profile(interactive=True), shared by all parachutes
+    _fig = None
+    _ax = None
+    _line = None
+    _vline = None
 
     def report(self):
         print(f"\n--- Parachute Report ---")
@@ -31,14 +122,17 @@ class Parachute(Report):
         self.drag_coefficient = drag_coefficient
         self.mass = mass
         self.shape = shape.lower()  # Lowercase a text
+        self._shape_id = _PARACHUTE_SHAPES.get(self.shape, _DEFAULT_SHAPE)  # Index into the shape tables
+        self._inflation_time = None  # Set below, once the drag area is known
 
         self.calculate_drag_area()  # Calculate the effective drag area based on the shape and diameter 
 
         # If the user does not provide a suspension line length,
         # estimate it based on the diameter and shape of the parachute    
+        # (the shape id is already resolved, so the tables are indexed directly)
 
         if suspension_line_length is None:
-            self.suspension_line_length = self.estimate_suspension_line_length(self.diameter, self.shape)
+            self.suspension_line_length = _SL_RATIO[self._shape_id] * self.diameter
         else:
             self.suspension_line_length = suspension_line_length
 
@@ -46,13 +140,74 @@ class Parachute(Report):
         # estimate them based on the shape of the parachute
 
         if opening_force_coefficient is None or inflation_time is None:
-            Cx, t_inf = self.estimate_opening_parameters(self.shape)
+            Cx, t_inf = _OPEN_CX[self._shape_id], _OPEN_T[self._shape_id]
             self.opening_force_coefficient = Cx if opening_force_coefficient is None else opening_force_coefficient
             self.inflation_time = t_inf if inflation_time is None else inflation_time
         else:
             self.opening_force_coefficient = opening_force_coefficient
             self.inflation_time = inflation_time
 
+    @property
+    def drag_area(self):
+        return self._drag_area
+
+    @drag_area.setter
+    def drag_area(self, value):
+        """
+        Set the effective drag area (Cd * A) and refresh the constants that depend on it
+        """
+        self._drag_area = value
+        if self._inflation_time is not None:  # None only while __init__ runs; the inflation_time setter refreshes then
+            self._update_inflation_constants()
+
+    @property
+    def inflation_time(self):
+        return self._inflation_time
+
+    @inflation_time.setter
+    def inflation_time(self, value):
+        """
+        Set the inflation time and refresh the constants that depend on it
+        """
+        if value <= 0:
+            raise ValueError("Inflation time must be greater than zero.")
+        self._inflation_time = value
+        self._update_inflation_constants()
+
+    @classmethod
+    def batch(cls, diameters, drag_coefficients, shapes="hemispherical"):
+        """
+        Method to compute the properties of many parachutes at once (e.g. for a Monte Carlo sweep)
+        without building one Parachute object per sample.
+
+        Args:
+        - diameters (array-like): Diameters of the parachutes (m)
+        - drag_coefficients (array-like or float): Drag coefficients (Cd)
+        - shapes (str or list of str): One shape for all parachutes, or one shape per parachute
+
+        Returns a ParachuteBatch with the estimated opening force coefficient, inflation time
+        and suspension line length of each parachute.
+        """
+        d, cd = np.broadcast_arrays(np.asarray(diameters, dtype=float), np.asarray(drag_coefficients, dtype=float))
+        if isinstance(shapes, str):
+            shapes = [shapes] * d.size
+        shapes = [shape.lower() for shape in shapes]
+        if len(shapes) != d.size:
+            raise ValueError("Number of shapes must match the number of parachutes.")
+
+        shape_ids = np.fromiter((_PARACHUTE_SHAPES.get(shape, _DEFAULT_SHAPE) for shape in shapes),
+                                dtype=np.intp, count=len(shapes)).reshape(d.shape)
+
+        # Same tables as __init__ and calculate_drag_area, gathered for all parachutes at once
+        surface_area = np.take(_AREA_FACTOR, shape_ids) * d * d
+        return ParachuteBatch(
+            drag_area=cd * surface_area,
+            surface_area=surface_area,
+            inflation_time=np.take(_OPEN_T, shape_ids),
+            opening_force_coefficient=np.take(_OPEN_CX, shape_ids),
+            suspension_line_length=np.take(_SL_RATIO, shape_ids) * d,
+        )
+
     @staticmethod  
     # static method is used to define a method that does not depend on instance variables, 
     # because it only uses the shape parameter to estimate the opening parameters
@@ -61,57 +216,59 @@ class Parachute(Report):
         """
         Method to estimate the opening force coefficient and inflation time
         """
-        # Coefficients and times based on the shape of the parachute
-        shape_presets = {
-            "flat": (1.8, 0.7),
-            "hemispherical": (1.5, 1.0),
-            "conical": (1.3, 1.2),
-            "ribbon": (1.0, 1.8),
-            "reefed": (0.6, 2.0),
-            "guide_surface": (1.4, 1.0),
-            "square": (1.2, 1.0)  # Assuming square parachute has similar properties to hemispherical
-        }
-        return shape_presets.get(shape.lower(), (1.5, 1.0))  # default values if shape not found
+        shape_id = _PARACHUTE_SHAPES.get(shape.lower(), _DEFAULT_SHAPE)
+        return _OPEN_CX[shape_id], _OPEN_T[shape_id]
     
     @staticmethod
     def estimate_suspension_line_length(diameter, shape="hemispherical"):
         """
         Method to estimate the suspension line length based on the diameter and shape of the parachute
         """
-        ratios = {
-            "flat": 1.0,
-            "hemispherical": 1.2,
-            "conical": 1.3,
-            "square": 1.1,
-            "guide_surface": 1.3,
-            "ribbon": 1.0,
-            "reefed": 1.0
-        }
-        factor = ratios.get(shape.lower(), 1.2)  # The factor depends on the shape of the parachute
+        factor = _SL_RATIO[_PARACHUTE_SHAPES.get(shape.lower(), _DEFAULT_SHAPE)]  # The factor depends on the shape of the parachute
         return factor * diameter
     
     def print_area(self):
-        print(f"Drag area for {self.shape} parachute is: {self.drag_area:.4f} m²")
+        sys.stdout.write(f"Drag area for {self.shape} parachute is: {self.drag_area:.4f} m²\n")
 
     def calculate_drag_area(self):
         """
         Method to calculate the effective drag area, depending on the shape of the parachute.
+        Stores surface_area, area and drag_area and returns drag_area; call it again after changing
+        the diameter or drag coefficient.
         """
-        if self.shape == "square":
-            self.surface_area = self.diameter ** 2  # Diameter is the side length for square parachutes
-        else:
-            self.surface_area = (math.pi / 4) * self.diameter ** 2  # Circular by default
-        self.drag_area = self.drag_coefficient * self.surface_area
+        d = self.diameter
+        # Diameter is the side length for square parachutes, circular otherwise (see _AREA_FACTOR)
+        self.surface_area = _AREA_FACTOR[self._shape_id] * d * d
+        self.area = self.surface_area
+        self.drag_area = self.drag_coefficient * self.surface_area  # The setter refreshes the inflation constants
+        return self.drag_area
+
+    def _update_inflation_constants(self):
+        """
+        Refresh drag_area / t_inf², used by get_inflated_drag_area and drag_force.
+        Called by the drag_area and inflation_time setters.
+        """
+        inv_tinf = 1.0 / self._inflation_time
+        self._area_over_tinf2 = self._drag_area * inv_tinf * inv_tinf
 
     def get_inflated_drag_area(self, time):
         """
-        Method to get the inflated drag area at a given time.    
+        Method to get the inflated drag area at a given time, or at every time of a NumPy array.
         """
-        if time >= self.inflation_time:
-            area = self.drag_area
-        else:
-            area = self.drag_area * (time / self.inflation_time) ** 2
-        return area
+        return _inflated_area(time, self._area_over_tinf2, self._inflation_time)
+
+    def drag_force(self, time, rho, v_sq):
+        """
+        Method to get the drag force of the inflating parachute in one call
+        (same as 0.5 * rho * v² * get_inflated_drag_area(time))
+        Formula: F = 0.5 * rho * v² * drag_area * min(t / t_inf, 1)²
+
+        Args:
+        - time (float): Time since deployment (s)
+        - rho (float): Air density (kg/m³)
+        - v_sq (float): Squared velocity (m²/s²)
+        """
+        return 0.5 * rho * v_sq * _inflated_area(time, self._area_over_tinf2, self._inflation_time)
 
     def is_fully_inflated(self, time):
         """ 
@@ -119,17 +276,24 @@ class Parachute(Report):
         """
         return time >= self.inflation_time
 
-    def plot_inflation_profile(self, t_max=None, steps=100):
+    def plot_inflation_profile(self, t_max=None, steps=100, interactive=False):
         """
         Method to plot the inflation profile of the parachute over time
         If t_max is not provided, it defaults to 1.5 times the inflation time
+        If interactive is True, one figure is kept and its curve is updated on every call
+        instead of opening a new figure (useful when plotting many parachutes in a loop)
         """
+        import matplotlib.pyplot as plt  # Imported lazily so importing parachute does not load pyplot
+
         if t_max is None:
             t_max = self.inflation_time * 1.5
 
-        # times: list of time points at which the drag area will be evaluated and plotted
-        times = [t_max * i / steps for i in range(steps + 1)] 
-        areas = [self.get_inflated_drag_area(t) for t in times]
+        # times: time points at which the drag area will be evaluated and plotted
+        # areas: get_inflated_drag_area at those times, cached for repeated profiles
+        times, areas = _inflation_samples(t_max, steps, self._inflation_time, self._area_over_tinf2)
+
+        if interactive:
+            return self._update_inflation_figure(plt, times, areas)
 
         plt.figure(figsize=(6, 4))
         plt.plot(times, areas, label="Inflated Drag Area", color='blue')
@@ -142,8 +306,33 @@ class Parachute(Report):
         plt.tight_layout()
         plt.show()
 
+    def _update_inflation_figure(self, plt, times, areas):
+        """
+        Draw the inflation profile on the shared figure, creating it only the first time
+        (or again if the user closed it)
+        """
+        cls = type(self)
+        if cls._fig is None or not plt.fignum_exists(cls._fig.number):
+            cls._fig, cls._ax = plt.subplots(figsize=(6, 4))
+            cls._line, = cls._ax.plot([], [], label="Inflated Drag Area", color='blue')
+            cls._vline = cls._ax.axvline(0.0, color='r', linestyle='--', label="Inflation Time")
+            cls._ax.set_xlabel("Time [s]")
+            cls._ax.set_ylabel("Effective Drag Area [m²]")
+            cls._ax.grid(True)
+            cls._ax.legend()
+            cls._fig.tight_layout()
+
+        cls._line.set_data(times, areas)
+        cls._vline.set_xdata([self.inflation_time, self.inflation_time])
+        cls._ax.set_title(f"Inflation Profile of the Parachute ({self.shape})")
+        cls._ax.relim()
+        cls._ax.autoscale_view()
+        cls._fig.canvas.draw_idle()
+        plt.show(block=False)
+        return cls._fig
+
     def parachute_data(self):
-        print(
+        sys.stdout.write(
             f"Parachute data:\n"
             f"  Shape: {self.shape}\n"
             f"  Diameter: {self.diameter} m\n"
@@ -152,7 +341,8 @@ class Parachute(Report):
             f"  Drag Coefficient (Cd): {self.drag_coefficient}\n"
             f"  Opening Force Coefficient (Cx): {self.opening_force_coefficient}\n"
             f"  Inflation Time: {self.inflation_time} s\n"
-            f"  Area: {self.area:.3f} m²"
+            f"  Area: {self.area:.3f} m²\n"
         )
 
-p1 = Parachute(10, 1.5, mass= 5, shape="reefed")
\ No newline at end of file
+if __name__ == "__main__":
+    p1 = Parachute(10, 1.5, mass= 5, shape="reefed")
@@ -1,3 +1,5 @@
 class Report:
+    __slots__ = ()
+
     def status_report(self):
         raise NotImplementedError("This method should be overridden by subclasses.")